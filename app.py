@@ -1,17 +1,30 @@
 import os
+import sys
+import json
+import time
 import logging
 from dotenv import load_dotenv
 import streamlit as st
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain.chains import ConversationalRetrievalChain
 from langchain_community.vectorstores import FAISS
+from langchain_community.docstore.in_memory import InMemoryDocstore
+from langchain_core.documents import Document
 import google.generativeai as genai
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
-import requests
+import asyncio
+import importlib.util
+import httpx
 import re
 from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urldefrag, urljoin, urlparse
 import faiss
+import hashlib
+import threading
+import contextlib
+from collections import OrderedDict
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 
 
 # Configure logging
@@ -24,6 +37,60 @@ load_dotenv()
 if not os.getenv('GOOGLE_API_KEY'):
     raise ValueError("GOOGLE_API_KEY environment variable not set")
 
+# Location of the persisted FAISS index
+VECTOR_STORE_PATH = "faiss_index"
+
+# Chunk size and overlap, measured in tokens
+CHUNK_ENCODING = "cl100k_base"
+CHUNK_TOKENS = 512
+CHUNK_OVERLAP_TOKENS = 128
+
+# Saved indexes older than this many seconds are rebuilt on startup
+INDEX_MAX_AGE = 24 * 60 * 60
+
+# Build marker written next to the index. Bump the version whenever chunking,
+# metadata or the index layout changes so older indexes get rebuilt
+INDEX_MARKER_FILE = "build.json"
+INDEX_FORMAT_VERSION = 1
+
+# Corpora larger than this are indexed with IVF+PQ instead of SQ8
+IVF_MIN_VECTORS = 10_000
+IVF_INDEX_FACTORY = "IVF64,PQ16"
+IVF_NPROBE = 8
+
+# Chunks per batch embedding request and number of requests in flight.
+# embed_documents also caps each request at ~20,000 estimated tokens (about twice the
+# words, punctuation and spaces), so a 512-token chunk counts as roughly 1,500-2,000
+# and ten of them fit in one request.
+EMBED_BATCH_SIZE = 10
+EMBED_WORKERS = 8
+
+# Concurrent page fetches and pooled connections used while crawling
+SCRAPE_CONCURRENCY = 10
+SCRAPE_MAX_CONNECTIONS = 20
+
+# Per-request timeout in seconds and connection retries while crawling
+SCRAPE_TIMEOUT = 10
+SCRAPE_RETRIES = 2
+
+# httpx only speaks HTTP/2 when the optional h2 package is installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Number of Gemini answers kept in memory
+REFRAME_CACHE_SIZE = 256
+
+# Parse with the C-backed lxml parser, or Python's built-in one if lxml is missing
+HTML_PARSER = 'lxml' if importlib.util.find_spec("lxml") is not None else 'html.parser'
+
+# Matches heading tag names (h1 - h6)
+HEADING_RE = re.compile('^h[1-6]$')
+
+# Word tokens used for keyword matching
+WORD_RE = re.compile(r'\b\w+\b')
+
+# Contact information patterns
+EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+PHONE_RE = re.compile(r'\+?\d[\d -]{8,}\d')
 
 
 def scrape_website_content(url, depth=2):
@@ -32,71 +99,104 @@ def scrape_website_content(url, depth=2):
     Optionally extracts content from linked pages up to a specified depth.
     """
 
-    def extract_content_from_soup(soup):
-    # Extract headings (h1 - h6)
-        headings = [heading.get_text(strip=True) for heading in soup.find_all(re.compile('^h[1-6]$'))]
-        heading_text = "\n".join(headings)
+    seen = set()  # Hashes of text lines already kept anywhere in the crawl
 
-    # Extract paragraphs
-        paragraphs = [para.get_text(strip=True) for para in soup.find_all('p')]
-        paragraph_text = "\n".join(paragraphs)
+    def novel(lines):
+        """
+        Returns the lines whose text has not been kept from any earlier page.
+        """
+        kept = []
+        for line in lines:
+            line_hash = hash(line)
+            if line_hash not in seen:
+                seen.add(line_hash)
+                kept.append(line)
+        return kept
 
-    # Extract list items from unordered and ordered lists
-        list_items = [li.get_text(strip=True) for li in soup.find_all('li')]
-        list_text = "\n".join(list_items)
-
-    # **Updated**: Extract links and their text or icons (anchor tags)
+    def extract_content_from_soup(soup):
+        """
+        Walks the parse tree once, collecting each kind of element as it is found.
+        Returns the page content and the hrefs of its links.
+        """
+        headings = []
+        paragraphs = []
+        list_items = []
         links = []
-        for a_tag in soup.find_all('a', href=True):
-        # Check for text in the <a> tag
-            link_text = a_tag.get_text(strip=True)
-        
-        # If no text, check if it has an image or icon inside
-            if not link_text:
-            # Get the 'alt' attribute of images or icon classes
-                images = a_tag.find_all('img')
-                if images:
-                    link_text = ', '.join([img.get('alt', 'Image without alt text') for img in images])
-                else:
-                # If there is an icon (e.g., a <span> or <i> tag for icons)
-                    icons = a_tag.find_all(['span', 'i'])
-                    if icons:
-                        link_text = 'Icon link'
-        
-        # Append the link with either its text or description
-            links.append((link_text, a_tag.get('href')))
-    
-        link_text = "\n".join([f"Link text: {text or 'No text'}, URL: {href}" for text, href in links])
-
-    # Extract table data (table headers and cells)
         tables = []
-        for table in soup.find_all('table'):
-            headers = [header.get_text(strip=True) for header in table.find_all('th')]
-            rows = []
-            for row in table.find_all('tr'):
-                rows.append([cell.get_text(strip=True) for cell in row.find_all(['td', 'th'])])
-            tables.append({"headers": headers, "rows": rows})
-
+        meta_descriptions = []
+        image_alts = []
+
+        for element in soup.find_all(True):
+            name = element.name
+
+        # Extract headings (h1 - h6)
+            if HEADING_RE.match(name):
+                headings.append(element.get_text(strip=True))
+
+        # Extract paragraphs
+            elif name == 'p':
+                paragraphs.append(element.get_text(strip=True))
+
+        # Extract list items from unordered and ordered lists
+            elif name == 'li':
+                list_items.append(element.get_text(strip=True))
+
+        # **Updated**: Extract links and their text or icons (anchor tags)
+            elif name == 'a' and element.has_attr('href'):
+            # Check for text in the <a> tag
+                link_text = element.get_text(strip=True)
+
+            # If no text, check if it has an image or icon inside
+                if not link_text:
+                # Get the 'alt' attribute of images or icon classes
+                    images = element.find_all('img')
+                    if images:
+                        link_text = ', '.join([img.get('alt', 'Image without alt text') for img in images])
+                    else:
+                    # If there is an icon (e.g., a <span> or <i> tag for icons)
+                        icons = element.find_all(['span', 'i'])
+                        if icons:
+                            link_text = 'Icon link'
+
+            # Append the link with either its text or description
+                links.append((link_text, element.get('href')))
+
+        # Extract table data (table headers and cells)
+            elif name == 'table':
+                headers = [header.get_text(strip=True) for header in element.find_all('th')]
+                rows = []
+                for row in element.find_all('tr'):
+                    rows.append([cell.get_text(strip=True) for cell in row.find_all(['td', 'th'])])
+                tables.append({"headers": headers, "rows": rows})
+
+        # Extract meta descriptions
+            elif name == 'meta' and element.get('name') == 'description':
+                meta_descriptions.append(element.get('content', ''))
+
+        # Extract alt text from images
+            elif name == 'img' and element.get('alt'):
+                image_alts.append(element.get('alt', '').strip())
+
+        # Drop lines already kept from another page (menus, footers, repeated descriptions)
+        heading_text = "\n".join(novel(headings))
+        paragraph_text = "\n".join(novel(paragraphs))
+        list_text = "\n".join(novel(list_items))
+        link_text = "\n".join(novel([f"Link text: {text or 'No text'}, URL: {href}" for text, href in links]))
         table_text = "\n".join(
             [f"Table {i+1}:\nHeaders: {', '.join(table['headers'])}\nRows:\n" + "\n".join([', '.join(row) for row in table['rows']]) 
              for i, table in enumerate(tables)]
         )
-
-    # Extract meta descriptions
-        meta_descriptions = [meta.get('content', '') for meta in soup.find_all('meta', {'name': 'description'})]
-        meta_text = "\n".join(meta_descriptions)
+        meta_text = "\n".join(novel(meta_descriptions))
+        image_alt_text = "\n".join(novel(image_alts))
 
     # Extract contact information (emails and phone numbers)
+        full_text = soup.get_text()
         contact_info = []
-        emails = re.findall(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', soup.get_text())
-        phone_numbers = re.findall(r'\+?\d[\d -]{8,}\d', soup.get_text())
+        emails = EMAIL_RE.findall(full_text)
+        phone_numbers = PHONE_RE.findall(full_text)
         contact_info.extend(emails)
         contact_info.extend(phone_numbers)
-        contact_info_text = "\n".join(contact_info)
-
-    # Extract alt text from images
-        image_alts = [img.get('alt', '').strip() for img in soup.find_all('img') if img.get('alt')]
-        image_alt_text = "\n".join(image_alts)
+        contact_info_text = "\n".join(novel(contact_info))
 
     # Combine everything into a single content string
         content = (
@@ -109,73 +209,148 @@ def scrape_website_content(url, depth=2):
             f"Contact Info:\n{contact_info_text}\n\n"
             f"Image Alt Text:\n{image_alt_text}\n"
         )
-        return content
+        return content, [href for _, href in links]
 
 
-    def scrape_recursive(url, depth):
-        if depth < 0:
-            return ""
+    visited = set()  # URLs already fetched anywhere in the crawl
+
+    async def scrape_recursive(client, semaphore, url, depth):
+        """
+        Returns the content of the page and its linked pages as a list, one entry per page.
+        """
+        if depth < 0 or url in visited:
+            return []
+        visited.add(url)
 
         print(f"Scraping {url} at depth {depth}")
-        content = ""
+        parts = []
 
         try:
-            response = requests.get(url)
+            async with semaphore:
+                response = await client.get(url)
             response.raise_for_status()  # Check for HTTP errors
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER)
 
-            # Extract content from the current page
-            content += extract_content_from_soup(soup)
+            # Extract content and links from the current page
+            page_content, hrefs = extract_content_from_soup(soup)
+            parts.append(page_content)
 
             if depth > 0:
                 # Find and scrape linked pages
                 links = set()  # Use a set to avoid duplicate links
-                for a_tag in soup.find_all('a', href=True):
-                    link = a_tag.get('href')
-                    full_url = urljoin(url, link)  # Resolve relative URLs
-                    if full_url.startswith('http') and not full_url.startswith(url):  # Avoid internal links if necessary
+                for link in hrefs:
+                    full_url = urldefrag(urljoin(url, link)).url  # Resolve relative URLs and drop fragments
+                    if full_url.startswith('http') and not full_url.startswith(url) and full_url not in visited:  # Avoid internal links if necessary
                         links.add(full_url)
 
-                # Recursively scrape linked pages
-                for link in links:
-                    content += "\n\n---\n\n" + scrape_recursive(link, depth - 1)
+                # Recursively scrape linked pages concurrently
+                results = await asyncio.gather(
+                    *[scrape_recursive(client, semaphore, link, depth - 1) for link in links]
+                )
+                for result in results:
+                    parts.extend(result)
 
-        except requests.RequestException as e:
+        except (httpx.HTTPError, httpx.InvalidURL) as e:
             print(f"Request error while scraping {url}: {e}")
  
-        return content
+        return parts
+
+    async def scrape():
+        # One pooled client shared by every page of the crawl, retrying failed connections;
+        # falls back to HTTP/1.1 keep-alive when h2 is missing
+        limits = httpx.Limits(max_connections=SCRAPE_MAX_CONNECTIONS, max_keepalive_connections=SCRAPE_MAX_CONNECTIONS)
+        transport = httpx.AsyncHTTPTransport(http2=HTTP2_AVAILABLE, limits=limits, retries=SCRAPE_RETRIES)
+        async with httpx.AsyncClient(transport=transport, follow_redirects=True, timeout=SCRAPE_TIMEOUT) as client:
+            parts = await scrape_recursive(client, asyncio.Semaphore(SCRAPE_CONCURRENCY), url, depth)
+        return "\n\n---\n\n".join(parts)
 
-    return scrape_recursive(url, depth)
+    return asyncio.run(scrape())
 
 
 def process_website(url):
     """
-    Processes the website: scrapes text, splits it into chunks,
-    and converts chunks into embeddings.
+    Processes the website: scrapes text and splits it into chunks.
     """
     print(f"Processing website: {url}")
     text = scrape_website_content(url)
 
-    # Split text into manageable chunks
-    text_splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
+    # Split text into token-sized chunks with a 0.75 stride
+    text_splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+        encoding_name=CHUNK_ENCODING, chunk_size=CHUNK_TOKENS, chunk_overlap=CHUNK_OVERLAP_TOKENS
+    )
     chunks = text_splitter.split_text(text)
     print(f"Text split into {len(chunks)} chunks")
+    return chunks
+
+def embed_chunks(embeddings, text_chunks):
+    """
+    Embeds the text chunks in batches of EMBED_BATCH_SIZE, running several batches
+    concurrently over the embeddings client's shared connection.
+    embed_documents may still split a batch of unusually long chunks into more requests.
+    Returns a float32 matrix with one row per chunk.
+    """
+    starts = range(0, len(text_chunks), EMBED_BATCH_SIZE)
+    batches = [text_chunks[start:start + EMBED_BATCH_SIZE] for start in starts]
+    vectors = None
+    with ThreadPoolExecutor(max_workers=EMBED_WORKERS) as executor:
+        results = executor.map(lambda batch: embeddings.embed_documents(batch, batch_size=EMBED_BATCH_SIZE), batches)
+
+        # Copy each batch straight into its rows of the preallocated matrix
+        for start, batch_vectors in zip(starts, results):
+            if vectors is None:
+                vectors = np.empty((len(text_chunks), len(batch_vectors[0])), dtype=np.float32)
+            vectors[start:start + len(batch_vectors)] = batch_vectors
+    return vectors
+
+
+def build_index(vectors):
+    """
+    Builds the FAISS index for the given embedding matrix.
+    Large corpora use IVF+PQ for sub-linear search; small ones use an 8-bit scalar
+    quantized index, a quarter of the memory of a flat float32 index.
+    """
+    dim = vectors.shape[1]
+    if len(vectors) <= IVF_MIN_VECTORS:
+        index = faiss.IndexScalarQuantizer(dim, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_L2)
+    else:
+        index = faiss.index_factory(dim, IVF_INDEX_FACTORY, faiss.METRIC_L2)
+        faiss.extract_index_ivf(index).nprobe = IVF_NPROBE
+    index.train(vectors)
+    index.add(vectors)
+    return index
 
-    chunks_with_sources = [(chunk, {"source": url}) for chunk in chunks]
-    return chunks_with_sources
 
 def upload_website_data(url):
     """
     Scrapes the website, processes the content, and saves it into a FAISS vector store.
     """
     print(f"Uploading website data for {url}")
-    chunks_with_sources = process_website(url)
-    if chunks_with_sources:
-        text_chunks, metadata = zip(*chunks_with_sources)
+    text_chunks = process_website(url)
+    if text_chunks:
         print(f"Creating embeddings for {len(text_chunks)} chunks")
         embeddings = GoogleGenerativeAIEmbeddings(api_key=os.getenv('GOOGLE_API_KEY'), model="models/text-embedding-004")
-        vector_store = FAISS.from_texts(text_chunks, embedding=embeddings, metadatas=metadata)
-        vector_store.save_local("faiss_index")
+        vectors = embed_chunks(embeddings, text_chunks)
+
+        # Build the vector store directly from the embedding matrix
+        # Store each chunk's lowercase tokens so queries don't recompute them
+        ids = [str(i) for i in range(len(text_chunks))]
+        docstore = InMemoryDocstore({
+            doc_id: Document(
+                page_content=chunk,
+                metadata={"source": url, "tokens": frozenset(WORD_RE.findall(chunk.lower()))},
+            )
+            for doc_id, chunk in zip(ids, text_chunks)
+        })
+        vector_store = FAISS(
+            embedding_function=embeddings,
+            index=build_index(vectors),
+            docstore=docstore,
+            index_to_docstore_id=dict(enumerate(ids)),
+        )
+        vector_store.save_local(VECTOR_STORE_PATH)
+        with open(os.path.join(VECTOR_STORE_PATH, INDEX_MARKER_FILE), "w") as marker:
+            json.dump({"built_at": time.time(), "format_version": INDEX_FORMAT_VERSION}, marker)
+        _get_vector_store.clear()  # Drop any stale in-memory copy of the index
         print("FAISS index created or updated successfully.")
     else:
         print("No valid website data to process.")
@@ -183,7 +358,41 @@ def upload_website_data(url):
 
 
     
-def reframe_with_gemini(text,question):
+def index_is_fresh():
+    """
+    Returns True if the saved FAISS index was built by this version of the indexing code
+    less than INDEX_MAX_AGE seconds ago, according to its build marker.
+    File modification times are not used, since a git checkout resets them.
+    """
+    try:
+        with open(os.path.join(VECTOR_STORE_PATH, INDEX_MARKER_FILE)) as marker:
+            build = json.load(marker)
+        return (
+            build.get("format_version") == INDEX_FORMAT_VERSION
+            and time.time() - build.get("built_at", 0) < INDEX_MAX_AGE
+        )
+    except (OSError, ValueError, AttributeError, TypeError):
+        return False  # Missing or unreadable marker
+
+
+@st.cache_resource
+def ensure_website_data(url, force=False):
+    """
+    Scrapes and indexes the website unless a fresh index is already saved.
+    Runs once per process, so Streamlit reruns don't repeat the check.
+    """
+    if not force and index_is_fresh():
+        print("Using existing FAISS index")
+        return
+    print("Starting to upload website data")
+    upload_website_data(url)  # Scrape and process the website
+
+
+@st.cache_resource
+def _get_gemini_model():
+    """
+    Configures the Gemini client and builds the generative model once per process.
+    """
     # Configure the API key from the environment variable
     genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
     
@@ -195,10 +404,30 @@ def reframe_with_gemini(text,question):
     }
     
     # Initialize the model
-    model = genai.GenerativeModel(
+    return genai.GenerativeModel(
         model_name="gemini-1.5-flash",
         generation_config=generation_config,
     )
+
+
+@st.cache_resource
+def _get_reframe_cache():
+    """
+    Returns the process-wide LRU cache of Gemini answers and the lock guarding it.
+    """
+    return OrderedDict(), threading.Lock()
+
+
+def reframe_with_gemini(text,question):
+    # Return the cached answer if this question was already asked over the same text
+    cache, lock = _get_reframe_cache()
+    key = hashlib.blake2b(f"{question}\0{text}".encode(), digest_size=16).hexdigest()
+    with lock:
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+    model = _get_gemini_model()
     
     # Prepare the prompt
     prompt = f"""You are a chatbot for an IT company website, tasked with answering user questions based on the provided website text. When responding, please:
@@ -222,7 +451,12 @@ Website Text: {text}
         
         # Extract and return the content
         if hasattr(response, 'candidates') and len(response.candidates) > 0:
-            return response.candidates[0].content.parts[0].text
+            answer = response.candidates[0].content.parts[0].text
+            with lock:
+                cache[key] = answer
+                if len(cache) > REFRAME_CACHE_SIZE:
+                    cache.popitem(last=False)
+            return answer
         else:
             print("No candidates found in the response.")
             return None
@@ -256,32 +490,68 @@ def extract_relevant_information(question, text_chunks, metadata):
     Extracts and aggregates relevant information based on the question.
     """
     relevant_info = []
-    keywords = re.findall(r'\b\w+\b', question.lower())
+    keywords = set(WORD_RE.findall(question.lower()))
+    if not keywords:
+        return relevant_info  # Nothing to match against
     
     for chunk, meta in zip(text_chunks, metadata):
-        chunk_lower = chunk.lower()
-        if any(keyword in chunk_lower for keyword in keywords):
+        # Use the tokens precomputed at index time; older indexes don't store them
+        chunk_tokens = meta.get("tokens") or frozenset(WORD_RE.findall(chunk.lower()))
+        if not keywords.isdisjoint(chunk_tokens):
             relevant_info.append((chunk, meta))
     
     return relevant_info
 
+@st.cache_resource
+def _get_vector_store():
+    """
+    Loads the FAISS index and its embeddings client once and keeps them in memory across reruns.
+    Also returns the lock that searches must hold, since all Streamlit sessions share the index.
+    """
+    embeddings = GoogleGenerativeAIEmbeddings(api_key=os.getenv('GOOGLE_API_KEY'), model="models/text-embedding-004")
+    vector_store = FAISS.load_local(VECTOR_STORE_PATH, embeddings=embeddings, allow_dangerous_deserialization=True)
+
+    # Set the number of probed lists for IVF indexes
+    try:
+        faiss.extract_index_ivf(vector_store.index).nprobe = IVF_NPROBE
+    except RuntimeError:
+        pass  # Not an IVF index
+
+    # CPU indexes can be searched from several threads at once
+    search_lock = contextlib.nullcontext()
+
+    # Move the index to the GPU when a GPU build of FAISS and a device are available
+    if hasattr(faiss, "StandardGpuResources") and faiss.get_num_gpus() > 0:
+        try:
+            index = vector_store.index
+            if isinstance(index, faiss.IndexScalarQuantizer):
+                # Flat SQ8 has no GPU version, so search its decoded vectors with a GPU flat index
+                flat_index = faiss.IndexFlatL2(index.d)
+                flat_index.add(index.reconstruct_n(0, index.ntotal))
+                index = flat_index
+            vector_store.index = faiss.index_cpu_to_gpu(faiss.StandardGpuResources(), 0, index)
+            search_lock = threading.Lock()  # GPU indexes are not safe to search concurrently
+        except RuntimeError as e:
+            logging.warning(f"Could not move FAISS index to GPU, searching on CPU: {e}")
+    return vector_store, embeddings, search_lock
+
+
 def query(question, chat_history):
     """
     Processes a query using the conversational retrieval chain and returns a natural language response.
     """
     try:
-        # Initialize embeddings and vector store
-        embeddings = GoogleGenerativeAIEmbeddings(api_key=os.getenv('GOOGLE_API_KEY'), model="models/text-embedding-004")
-        vector_store_path = "faiss_index"
-        
         # Check if the FAISS index file exists
-        if not os.path.exists(vector_store_path):
-            raise FileNotFoundError(f"FAISS index file not found at path: {vector_store_path}")
+        if not os.path.exists(VECTOR_STORE_PATH):
+            raise FileNotFoundError(f"FAISS index file not found at path: {VECTOR_STORE_PATH}")
 
-        vector_store = FAISS.load_local(vector_store_path, embeddings=embeddings, allow_dangerous_deserialization=True)
+        # Reuse the cached vector store and embeddings
+        vector_store, embeddings, search_lock = _get_vector_store()
 
-        # Retrieve the relevant chunks based on the question
-        search_results = vector_store.similarity_search(question)
+        # Retrieve the relevant chunks based on the question, embedding it outside the search lock
+        question_embedding = embeddings.embed_query(question)
+        with search_lock:
+            search_results = vector_store.similarity_search_by_vector(question_embedding)
         if not search_results:
             return {"answer": "I couldn't find any relevant information.", "sources": []}
 
@@ -398,7 +668,7 @@ def show_ui():
 
 if __name__ == "__main__":
     website_url = "https://techshiney.com/"  # Change to your desired website URL
-    print("Starting to upload website data")
-    upload_website_data(website_url)  # Scrape and process the website
+    force_reindex = "--reindex" in sys.argv or os.getenv("REINDEX", "").strip().lower() in ("1", "true", "yes", "on")
+    ensure_website_data(website_url, force=force_reindex)
     print("Launching Streamlit UI")
     show_ui()
\ No newline at end of file